@@ -23,193 +23,623 @@ CORE ACTIONS:
 - READ:   Retrieve the most recent memo (-L) or search by keyword (-s).
 - UPDATE: Edit existing memos by ID (-U) using new piped input.
 - DELETE: Remove memos by ID (-D).
+
+DAEMON MODE:
+- If the companion `memos-clid.py` daemon is running, every action is sent to
+  it over a unix socket so the warm HTTP connection is reused and the per-call
+  start-up cost disappears. Without the daemon everything runs in-process.
 """
 
 import sys
 import os
+import re
+import json
+import functools
 import subprocess
 import shutil
-import argparse
+from pathlib import Path
 
-# 1. Dependency Guard: Ensure required non-standard libraries are installed
+# JSON codec: orjson (a Rust extension, several times faster on large memo
+# bodies) when installed, stdlib json otherwise. Both emit/accept bytes.
 try:
-    import requests
-    from dotenv import load_dotenv
-    from pathlib import Path
+    import orjson
 except ImportError:
-    print("Error: Missing dependencies.")
-    print("Please run: sudo apt install python3-requests python3-dotenv")
-    sys.exit(10)
+    orjson = None
+
+def json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# 1. Dependency Guard: requests (and its heavy urllib3 machinery) is imported
+#    lazily so --help, argparse errors and empty-input no-ops never pay for it;
+#    sys.modules makes repeated calls free
+def require_requests():
+    try:
+        import requests
+        return requests
+    except ImportError:
+        print("Error: Missing dependencies.")
+        print("Please run: sudo apt install python3-requests")
+        sys.exit(10)
+
+# 2. HTTP Session: One pooled Session per process so repeated API calls reuse
+#    the same TCP+TLS connection instead of handshaking again for every request
+_SESSION = None
+
+def get_session(token):
+    global _SESSION
+    if _SESSION is None:
+        requests = require_requests()
+        from urllib3.util.retry import Retry
+
+        # Transient gateway errors retry in-process with backoff instead of
+        # exiting 13 and making the user pay another cold start to re-run
+        retries = Retry(total=3, backoff_factor=0.3,
+                        status_forcelist=[429, 502, 503, 504],
+                        allowed_methods=frozenset(["GET", "POST", "PATCH", "DELETE"]),
+                        respect_retry_after_header=True)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                                max_retries=retries)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Advertise brotli only when a decoder is installed; gzip/deflate are
+        # always handled by urllib3 itself
+        encodings = "gzip, deflate"
+        for brotli_mod in ("brotli", "brotlicffi"):
+            try:
+                __import__(brotli_mod)
+                encodings += ", br"
+                break
+            except ImportError:
+                pass
+        session.headers.update({"Authorization": f"Bearer {token}",
+                                "Accept-Encoding": encodings})
+        _SESSION = session
+    return _SESSION
+
+# 3. Clipboard Integration: Supports Copying (for URLs) and Pasting (for -c flag)
+@functools.lru_cache(maxsize=None)
+def clip_tool(direction):
+    """Resolves the helper binary for 'copy' or 'paste' once per process.
+
+    Returns (absolute_path, tool_name) or None; the pre-resolved path walks
+    $PATH only on the first call and lets Popen skip execvp's own lookup.
+    """
+    names = ("xclip", "wl-copy") if direction == "copy" else ("xclip", "wl-paste")
+    for name in names:
+        path = shutil.which(name)
+        if path:
+            return path, name
+    return None
 
-# 2. Clipboard Integration: Supports Copying (for URLs) and Pasting (for -c flag)
 def copy_to_clipboard(text):
-    if shutil.which("xclip"):
-        subprocess.Popen(['xclip', '-selection', 'clipboard'], stdin=subprocess.PIPE).communicate(input=text.encode())
-    elif shutil.which("wl-copy"):
-        subprocess.Popen(['wl-copy'], stdin=subprocess.PIPE).communicate(input=text.encode())
+    tool = clip_tool("copy")
+    if not tool:
+        return
+    path, name = tool
+    cmd = [path, '-selection', 'clipboard', '-in'] if name == "xclip" else [path]
+    # Fire-and-forget: feed the helper and return without waiting on it, so
+    # the prompt comes back while xclip/wl-copy daemonizes in the background
+    try:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                start_new_session=True)
+        proc.stdin.write(text.encode())
+        proc.stdin.close()
+    except OSError:
+        pass
 
 def get_clipboard_text():
     """Reads text from the system clipboard using xclip or wl-paste."""
+    tool = clip_tool("paste")
+    if not tool:
+        return None
+    path, name = tool
+    cmd = [path, '-selection', 'clipboard', '-o'] if name == "xclip" else [path]
     try:
-        if shutil.which("xclip"):
-            return subprocess.check_output(['xclip', '-selection', 'clipboard', '-o']).decode().strip()
-        elif shutil.which("wl-paste"):
-            return subprocess.check_output(['wl-paste']).decode().strip()
+        return subprocess.check_output(cmd).decode().strip()
     except Exception:
         return None
-    return None
 
-# 3. Config Manager: Reads the ~/.memos.conf file and extracts credentials/feature toggles
+# 4. Config Manager: Reads the ~/.memos.conf file and extracts credentials/feature toggles.
+#    Cached so repeated callers (daemon mode, retries) never re-read the file.
+@functools.lru_cache(maxsize=1)
 def get_config():
     config_path = Path("~/.memos.conf").expanduser()
+    file_vars = {}
     if config_path.exists():
-        load_dotenv(dotenv_path=config_path)
-    
-    url = os.getenv('MEMOS_URL')
-    token = os.getenv('MEMOS_TOKEN')
-    visibility = os.getenv('MEMOS_VISIBILITY', 'PRIVATE')
-    adv_feat = os.getenv('MEMOS_ADVANCED_FEATURES', 'false').lower() == 'true'
-    
+        # The conf file only ever holds KEY="value" lines, so a tiny parser
+        # beats importing a full dotenv implementation on every invocation
+        for line in config_path.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            key, sep, value = line.partition('=')
+            if sep:
+                file_vars[key.strip()] = value.strip().strip('"').strip("'")
+
+    def lookup(key, default=None):
+        # Real environment variables win, matching load_dotenv's behavior
+        return os.environ.get(key) or file_vars.get(key, default)
+
+    url = lookup('MEMOS_URL')
+    token = lookup('MEMOS_TOKEN')
+    visibility = lookup('MEMOS_VISIBILITY') or 'PRIVATE'
+    adv_feat = (lookup('MEMOS_ADVANCED_FEATURES') or 'false').lower() == 'true'
+
     if not url or not token:
         print(f"Error: Credentials missing in {config_path}")
         sys.exit(12)
     return url.rstrip('/'), token, visibility, adv_feat
 
-# 4. Read Action: Fetches the single most recent memo from the API
+# Cache directory for responses that survive across invocations
+def cache_dir():
+    return Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "memos-cli"
+
+# 5. Input Reader: Shared stdin/clipboard capture for POST and UPDATE
+def read_input_data(from_clipboard=False, tty_error="Error: No piped input detected. Use -c to post from clipboard."):
+    if from_clipboard:
+        input_data = get_clipboard_text()
+        if not input_data:
+            print("Error: Clipboard is empty or utility (xclip/wl-paste) not found.")
+            sys.exit(11)
+        return input_data
+
+    if sys.stdin.isatty():
+        print(tty_error)
+        sys.exit(11)
+
+    # Read the raw bytes and decode once: the TextIO layer would build a list
+    # of chunks and join them, doubling peak memory on big piped payloads
+    input_data = sys.stdin.buffer.read().decode("utf-8", "replace").strip()
+    if not input_data:
+        sys.exit(0)
+    return input_data
+
+# Rendering helpers shared by the read actions
+_FENCE_RE = re.compile(r'```text\n|\n```')
+
+def memo_id_of(memo):
+    return memo.get("name", "").split('/')[-1]
+
+def memo_preview(content, width=60):
+    # One compiled substitution strips the fence markers, and partition grabs
+    # the first line without allocating the full split list
+    return _FENCE_RE.sub("", content, count=2).partition('\n')[0][:width]
+
+# 6. Read Action: Fetches the single most recent memo from the API. The last
+#    response is cached on disk with its ETag; on a 304 the server sends no
+#    body and the memo is rendered straight from the cache.
 def list_last_memo(base_url, token):
+    requests = require_requests()
     endpoint = f"{base_url}/api/v1/memos"
-    headers = {"Authorization": f"Bearer {token}"}
-    params = {"page_size": 1}
-    
+    # The field mask keeps newer servers (v0.24+) from shipping fields the
+    # render never touches; older ones ignore it
+    params = {"page_size": 1, "read_mask": "memos.name,memos.content"}
+
+    cache_path = cache_dir() / "last.json"
+    cache = None
+    headers = {}
     try:
-        response = requests.get(endpoint, headers=headers, params=params, timeout=10)
-        response.raise_for_status()
-        memos = response.json().get("memos", [])
-        
-        if not memos:
-            print("No memos found.")
-            return
+        cache = json_loads(cache_path.read_bytes())
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+    except (OSError, ValueError):
+        cache = None
 
-        last_memo = memos[0]
-        memo_id = last_memo.get("name", "").split('/')[-1]
+    try:
+        response = get_session(token).get(endpoint, params=params, headers=headers, timeout=10)
+        if response.status_code == 304 and cache and cache.get("memo"):
+            last_memo = cache["memo"]
+        else:
+            response.raise_for_status()
+            memos = json_loads(response.content).get("memos", [])
+
+            if not memos:
+                print("No memos found.")
+                return
+
+            last_memo = memos[0]
+            etag = response.headers.get("ETag")
+            if etag:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = cache_path.with_suffix(".tmp")
+                    tmp_path.write_bytes(json_dumps({"etag": etag, "memo": last_memo}))
+                    os.replace(tmp_path, cache_path)
+                except OSError:
+                    pass  # Cache is best-effort; the memo still renders
+
+        memo_id = memo_id_of(last_memo)
         content = last_memo.get("content", "")
         
-        print(f"--- Latest Memo [ID: {memo_id}] ---")
-        print(content)
-        print("----------------------------------")
-        print(f"URL: {base_url}/memos/{memo_id}")
+        # One write, one syscall, instead of four line-buffered prints
+        sys.stdout.write(
+            f"--- Latest Memo [ID: {memo_id}] ---\n"
+            f"{content}\n"
+            "----------------------------------\n"
+            f"URL: {base_url}/memos/{memo_id}\n")
         copy_to_clipboard(f"{base_url}/memos/{memo_id}")
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # ValueError covers unparseable bodies from both orjson and stdlib json
         print(f"Error: Could not list memo: {e}")
         sys.exit(13)
 
-# 5. Search Action: Uses API filters to find content containing a specific string
-def search_memos(base_url, token, query):
-    endpoint = f"{base_url}/api/v1/memos"
-    headers = {"Authorization": f"Bearer {token}"}
-    params = {"filter": f"content.contains('{query}')", "page_size": 5}
-    
+# 7. Search Action: Uses API filters to find content containing a specific
+#    string. The list request always rides the pooled session (and its retry
+#    policy); httpx/asyncio only dispatches per-memo follow-ups concurrently
+#    when a server build omits bodies from the list response.
+def fetch_search_page(base_url, token, params):
+    requests = require_requests()
     try:
-        response = requests.get(endpoint, headers=headers, params=params, timeout=10)
+        response = get_session(token).get(f"{base_url}/api/v1/memos", params=params, timeout=10)
         response.raise_for_status()
-        memos = response.json().get("memos", [])
-        
-        if not memos:
-            print(f"No memos found matching: '{query}'")
-            return
-
-        print(f"--- Search Results for '{query}' (Top 5) ---")
-        for m in memos:
-            mid = m.get("name", "").split('/')[-1]
-            preview = m.get("content", "").replace("```text\n", "").replace("\n```", "").split('\n')[0][:60]
-            print(f"[{mid}] {preview}...")
-        print("-------------------------------------------")
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content).get("memos", [])
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error: Search failed: {e}")
         sys.exit(13)
 
-# 6. Delete Action: Permanently removes a memo by its numeric ID
+async def fetch_memos_async(base_url, token, names):
+    """Fetches full memo objects concurrently; returns {name: memo}.
+
+    Best-effort enrichment: a follow-up that fails or returns junk just
+    leaves its list entry as-is instead of failing the whole search.
+    """
+    import asyncio
+    import httpx
+
+    headers = {"Authorization": f"Bearer {token}"}
+    # HTTP/2 multiplexes the sub-requests over one TLS connection, but it
+    # needs the optional h2 package, so fall back to HTTP/1.1 without it
+    try:
+        client = httpx.AsyncClient(http2=True, headers=headers, timeout=10)
+    except ImportError:
+        client = httpx.AsyncClient(headers=headers, timeout=10)
+    async with client:
+        replies = await asyncio.gather(
+            *[client.get(f"{base_url}/api/v1/{name}") for name in names],
+            return_exceptions=True)
+
+    filled = {}
+    for name, reply in zip(names, replies):
+        if isinstance(reply, Exception) or reply.status_code != 200:
+            continue
+        try:
+            filled[name] = reply.json()
+        except ValueError:
+            pass
+    return filled
+
+def search_memos(base_url, token, query):
+    import time
+    import hashlib
+
+    # Escape backslashes and quotes so the filter stays one CEL string
+    # literal no matter what the query contains
+    escaped = query.replace("\\", "\\\\").replace("'", "\\'")
+    # Only name and content feed the preview; mask the rest server-side
+    params = {"filter": f"content.contains('{escaped}')", "page_size": 5,
+              "read_mask": "memos.name,memos.content"}
+
+    # Re-running the same search within the TTL is served from disk with no
+    # network at all; MEMOS_SEARCH_TTL overrides the default, 0 disables
+    try:
+        ttl = float(os.environ.get("MEMOS_SEARCH_TTL", "30"))
+    except ValueError:
+        ttl = 30.0
+    cache_key = hashlib.sha1(f"{base_url}\0{query}".encode()).hexdigest()
+    cache_path = cache_dir() / "search" / f"{cache_key}.json"
+
+    memos = None
+    if ttl > 0:
+        try:
+            cached = json_loads(cache_path.read_bytes())
+            if time.time() - cached.get("ts", 0) < ttl:
+                memos = cached.get("results")
+        except (OSError, ValueError):
+            pass
+
+    if memos is None:
+        memos = fetch_search_page(base_url, token, params)
+        # Some server builds omit bodies from list responses; fill those in
+        # concurrently when httpx is available, else previews render empty
+        names = [m.get("name", "") for m in memos if "content" not in m]
+        if names:
+            try:
+                import asyncio
+                import httpx  # noqa: F401 -- availability probe
+            except ImportError:
+                pass
+            else:
+                filled = asyncio.run(fetch_memos_async(base_url, token, names))
+                memos = [filled.get(m.get("name", ""), m) if "content" not in m else m
+                         for m in memos]
+
+        if ttl > 0:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_bytes(json_dumps({"ts": time.time(), "results": memos}))
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # Cache is best-effort
+
+    if not memos:
+        print(f"No memos found matching: '{query}'")
+        return
+
+    # Build the whole listing and flush it with one write
+    lines = [f"--- Search Results for '{query}' (Top 5) ---"]
+    lines.extend(f"[{memo_id_of(m)}] {memo_preview(m.get('content', ''))}..." for m in memos)
+    lines.append("-------------------------------------------")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# 8. Delete Action: Permanently removes a memo by its numeric ID
 def delete_memo(base_url, token, memo_id):
+    requests = require_requests()
     endpoint = f"{base_url}/api/v1/memos/{memo_id}"
-    headers = {"Authorization": f"Bearer {token}"}
     try:
-        response = requests.delete(endpoint, headers=headers, timeout=10)
+        # Nothing in the body is rendered, so stream + close discards it
+        # without buffering or decoding
+        response = get_session(token).delete(endpoint, timeout=10, stream=True)
         response.raise_for_status()
+        response.close()
         print(f"Success: Memo {memo_id} deleted.")
     except requests.exceptions.RequestException as e:
         print(f"Error: Delete failed: {e}")
         sys.exit(13)
 
-# 7. Update Action: Replaces memo content using a PATCH request and piped input
-def update_memo(base_url, token, memo_id, visibility):
-    if sys.stdin.isatty():
-        print("Error: No piped input detected for update.")
-        sys.exit(11)
-    
-    input_data = sys.stdin.read().strip()
-    if not input_data:
-        sys.exit(0)
+# 9. Update Action: Replaces memo content using a PATCH request and piped input
+def update_memo(base_url, token, memo_id, visibility, input_data=None):
+    if input_data is None:
+        input_data = read_input_data(tty_error="Error: No piped input detected for update.")
 
+    requests = require_requests()
     endpoint = f"{base_url}/api/v1/memos/{memo_id}"
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
     payload = {"content": f"```text\n{input_data}\n```", "visibility": visibility}
-    
+
     try:
         url = f"{endpoint}?update_mask=content,visibility"
-        response = requests.patch(url, json=payload, headers=headers, timeout=10)
+        # Pre-encoded body via data= skips requests' own json round trip
+        body = json_dumps(payload)
+        # The returned memo object is never rendered; discard it undecoded
+        response = get_session(token).patch(url, data=body,
+                                            headers={"Content-Type": "application/json"},
+                                            timeout=10, stream=True)
         response.raise_for_status()
+        response.close()
         print(f"Success: Memo {memo_id} updated.")
     except requests.exceptions.RequestException as e:
         print(f"Error: Update failed: {e}")
         sys.exit(13)
 
-# 8. Post Action: Creates a new memo from piped data or clipboard (-c)
-def post_to_memos(show_delete, show_update, from_clipboard=False):
-    base_url, api_token, visibility, _ = get_config()
+# 10. Post Action: Creates new memos from piped data or clipboard (-c). With
+#     -b DELIM the input is split into records and each becomes its own memo,
+#     all posted over the same keep-alive connection instead of N invocations.
+def post_to_memos(base_url, token, visibility, show_delete, show_update,
+                  from_clipboard=False, input_data=None, batch_delim=None):
+    if input_data is None:
+        if not from_clipboard and not sys.stdin.isatty():
+            # Warm the pooled connection in the background while the pipe is
+            # read, hiding DNS + TCP + TLS setup behind stdin I/O. The session
+            # is created here, on the main thread, so the singleton is safe.
+            import threading
 
-    if from_clipboard:
-        input_data = get_clipboard_text()
-        if not input_data:
-            print("Error: Clipboard is empty or utility (xclip/wl-paste) not found.")
-            sys.exit(11)
-    else:
-        if sys.stdin.isatty():
-            print("Error: No piped input detected. Use -c to post from clipboard.")
-            sys.exit(11)
-        input_data = sys.stdin.read().strip()
+            warm_session = get_session(token)
 
-    if not input_data:
-        sys.exit(0)
+            def preconnect():
+                try:
+                    warm_session.head(f"{base_url}/api/v1/workspace/profile", timeout=5)
+                except Exception:
+                    pass  # Best-effort; the POST connects on its own if not
+
+            threading.Thread(target=preconnect, daemon=True).start()
+        input_data = read_input_data(from_clipboard)
+
+    if batch_delim:
+        # Let users write the delimiter as a shell-safe escape (\n\n, \0, \t)
+        try:
+            delim = batch_delim.encode().decode("unicode_escape")
+        except UnicodeDecodeError:
+            delim = batch_delim
+        records = [r.strip() for r in input_data.split(delim) if r.strip()]
+        if not records:
+            sys.exit(0)  # All records empty: same no-op as empty piped input
+    else:
+        records = [input_data]
 
-    memo_content = f"```text\n{input_data}\n```"
+    requests = require_requests()
     endpoint = f"{base_url}/api/v1/memos"
-    headers = {"Authorization": f"Bearer {api_token}", "Content-Type": "application/json"}
-    
+    session = get_session(token)
+
     try:
-        response = requests.post(endpoint, json={"content": memo_content, "visibility": visibility}, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        memo_id = data.get("name", "").split('/')[-1]
-        full_memo_url = f"{base_url}/memos/{memo_id}"
-        
-        print(f"Success: {full_memo_url}")
-        copy_to_clipboard(full_memo_url)
+        for record in records:
+            memo_content = f"```text\n{record}\n```"
+            # Pre-encoded body via data= skips requests' own json round trip
+            body = json_dumps({"content": memo_content, "visibility": visibility})
+            response = session.post(endpoint, data=body,
+                                    headers={"Content-Type": "application/json"}, timeout=10)
+            response.raise_for_status()
+
+            data = json_loads(response.content)
+            memo_id = memo_id_of(data)
+            full_memo_url = f"{base_url}/memos/{memo_id}"
+
+            print(f"Success: {full_memo_url}")
 
         script_name = os.path.basename(__file__)
-        if show_delete: 
+        if show_delete:
             print(f"To delete this memo run: {script_name} -D {memo_id}")
-        if show_update: 
+        if show_update:
             print(f"To update this memo run: [command] | {script_name} -U {memo_id}")
 
-    except requests.exceptions.RequestException as e:
+        copy_to_clipboard(full_memo_url)
+
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error: API Request failed: {e}")
         sys.exit(13)
 
-# 9. CLI Entry Point: Parses flags and routes to the correct function
+# 11. Daemon Mode: Long-lived server (memos-clid) holding the warm session,
+#     plus the client-side dispatch used by one-shot invocations
+def daemon_socket_path():
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR", f"/run/user/{os.getuid()}")
+    return os.path.join(runtime_dir, "memos.sock")
+
+def handle_daemon_frame(frame):
+    """Runs one decoded request frame and returns {"output": ..., "code": ...}."""
+    import io
+    import contextlib
+
+    base_url, token, visibility, adv_feat = get_config()
+    op = frame.get("op")
+    buffer = io.StringIO()
+    code = 0
+    try:
+        with contextlib.redirect_stdout(buffer):
+            if op == "post":
+                post_to_memos(base_url, token, visibility,
+                              frame.get("show_delete", False), frame.get("show_update", False),
+                              input_data=frame.get("content"), batch_delim=frame.get("batch_delim"))
+            elif op == "update":
+                update_memo(base_url, token, frame.get("id"), visibility, input_data=frame.get("content"))
+            elif op == "delete":
+                delete_memo(base_url, token, frame.get("id"))
+            elif op == "last":
+                list_last_memo(base_url, token)
+            elif op == "search":
+                search_memos(base_url, token, frame.get("query", ""))
+            else:
+                print(f"Error: Unknown daemon op '{op}'.")
+                code = 13
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 0
+    return {"output": buffer.getvalue(), "code": code}
+
+def serve_daemon():
+    import socket
+
+    get_config()  # Fail fast (exit 12) before binding if credentials are missing
+    sock_path = daemon_socket_path()
+    try:
+        os.unlink(sock_path)
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sock_path)
+    os.chmod(sock_path, 0o600)
+    server.listen(4)
+
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            # The server is single-threaded: a client that connects and goes
+            # silent must not wedge every later invocation
+            conn.settimeout(10)
+            try:
+                data = b""
+                while not data.endswith(b"\n"):
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+            except OSError:
+                continue  # Slow or vanished client; drop the connection
+            if not data.strip():
+                continue
+            try:
+                reply = handle_daemon_frame(json.loads(data))
+            except ValueError:
+                reply = {"output": "Error: Malformed daemon frame.\n", "code": 13}
+            except Exception as e:
+                # One bad request must never take the daemon down with it
+                reply = {"output": f"Error: Daemon request failed: {e}\n", "code": 13}
+            try:
+                conn.sendall(json.dumps(reply).encode() + b"\n")
+            except OSError:
+                pass  # Client went away; nothing to report to
+
+def dispatch_via_daemon(op, from_clipboard=False, **fields):
+    """Hands the action to a running memos-clid, if any.
+
+    Returns False when no daemon is listening so the caller falls back to
+    running the action in-process (the pre-daemon behavior). On success this
+    prints the daemon's output and exits with its code.
+    """
+    import socket
+
+    sock_path = daemon_socket_path()
+    if not os.path.exists(sock_path):
+        return False
+    try:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.settimeout(30)
+        conn.connect(sock_path)
+    except OSError:
+        return False
+
+    frame = {"op": op}
+    frame.update(fields)
+    if op == "post":
+        frame["content"] = read_input_data(from_clipboard)
+    elif op == "update":
+        frame["content"] = read_input_data(tty_error="Error: No piped input detected for update.")
+
+    try:
+        with conn:
+            conn.sendall(json.dumps(frame).encode() + b"\n")
+            data = b""
+            while not data.endswith(b"\n"):
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        reply = json.loads(data)
+    except (OSError, ValueError) as e:
+        print(f"Error: Daemon communication failed: {e}")
+        sys.exit(13)
+
+    sys.stdout.write(reply.get("output", ""))
+    sys.exit(reply.get("code", 0))
+
+# 12. CLI Entry Point: Parses flags and routes to the correct function. The
+#     common single-flag invocations are matched by hand first so they never
+#     pay for importing and running argparse; anything else falls through to
+#     the full parser (which also owns --help and error reporting).
 if __name__ == "__main__":
     base_url, token, visibility, adv_feat = get_config()
 
+    av = sys.argv[1:]
+    if not av:
+        dispatch_via_daemon("post", show_delete=False, show_update=False) \
+            or post_to_memos(base_url, token, visibility, False, False)
+        sys.exit(0)
+    elif av == ["-c"] and adv_feat:
+        dispatch_via_daemon("post", from_clipboard=True, show_delete=False, show_update=False) \
+            or post_to_memos(base_url, token, visibility, False, False, from_clipboard=True)
+        sys.exit(0)
+    elif av == ["-L"] and adv_feat:
+        dispatch_via_daemon("last") or list_last_memo(base_url, token)
+        sys.exit(0)
+    elif len(av) == 2 and av[0] in ("-s", "--search") and adv_feat:
+        dispatch_via_daemon("search", query=av[1]) or search_memos(base_url, token, av[1])
+        sys.exit(0)
+    elif len(av) == 2 and av[0] in ("-D", "--delete"):
+        dispatch_via_daemon("delete", id=av[1]) or delete_memo(base_url, token, av[1])
+        sys.exit(0)
+    elif len(av) == 2 and av[0] in ("-U", "--update"):
+        dispatch_via_daemon("update", id=av[1]) or update_memo(base_url, token, av[1], visibility)
+        sys.exit(0)
+
+    import argparse
+
     l_help = "List the most recent memo" if adv_feat else argparse.SUPPRESS
     s_help = "Search memos by keyword" if adv_feat else argparse.SUPPRESS
     c_help = "Post content directly from clipboard" if adv_feat else argparse.SUPPRESS
@@ -234,30 +664,36 @@ Examples:
     parser.add_argument("-L", "--last", action="store_true", help=l_help)
     parser.add_argument("-s", "--search", metavar="QUERY", help=s_help)
     parser.add_argument("-c", "--clipboard", action="store_true", help=c_help)
+    parser.add_argument("-b", "--batch", metavar="DELIM",
+                        help="Split piped input on DELIM (e.g. '\\n\\n' or '\\0') and post one memo per record")
     
     args = parser.parse_args()
 
     if args.last:
         if adv_feat:
-            list_last_memo(base_url, token)
+            dispatch_via_daemon("last") or list_last_memo(base_url, token)
         else:
             sys.exit(12)
     elif args.search:
         if adv_feat:
-            search_memos(base_url, token, args.search)
+            dispatch_via_daemon("search", query=args.search) or search_memos(base_url, token, args.search)
         else:
             sys.exit(12)
     elif args.clipboard:
         if adv_feat:
-            post_to_memos(args.d, args.u, from_clipboard=True)
+            dispatch_via_daemon("post", from_clipboard=True, show_delete=args.d, show_update=args.u,
+                                batch_delim=args.batch) \
+                or post_to_memos(base_url, token, visibility, args.d, args.u,
+                                 from_clipboard=True, batch_delim=args.batch)
         else:
             sys.exit(12)
     elif args.delete:
-        delete_memo(base_url, token, args.delete)
+        dispatch_via_daemon("delete", id=args.delete) or delete_memo(base_url, token, args.delete)
     elif args.update:
-        update_memo(base_url, token, args.update, visibility)
+        dispatch_via_daemon("update", id=args.update) or update_memo(base_url, token, args.update, visibility)
     else:
-        post_to_memos(args.d, args.u)
+        dispatch_via_daemon("post", show_delete=args.d, show_update=args.u, batch_delim=args.batch) \
+            or post_to_memos(base_url, token, visibility, args.d, args.u, batch_delim=args.batch)
 
 # --- CREDITS & DOCUMENTATION ---
 # Memos Project: https://github.com/usememos/memos
@@ -268,7 +704,7 @@ Examples:
 
 # --- EXIT CODE REFERENCE ---
 # 0:  Success
-# 10: Missing Python Libraries (requests/dotenv)
+# 10: Missing Python Libraries (requests)
 # 11: No Piped Input (Standard Input is a TTY)
 # 12: Missing Configuration (MEMOS_URL or MEMOS_TOKEN)
 # 13: API or Network Error (Timeout, 401 Unauthorized, etc.)
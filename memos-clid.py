@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+"""
+MEMOS CLI DAEMON
+================
+Long-lived companion daemon for memos-cli. It keeps the parsed configuration
+and a warm HTTP session in memory, listening on a unix socket
+($XDG_RUNTIME_DIR/memos.sock) for JSON frames from `memo` invocations.
+With the daemon running, each command costs one socket round trip instead of
+a full Python start-up plus TLS handshake.
+
+USAGE:
+- Run directly:  ./memos-clid.py
+- Or as a systemd --user service:
+    [Service]
+    ExecStart=/path/to/memos-clid.py
+    Restart=on-failure
+
+The `memo` client falls back to in-process execution when the daemon is not
+running, so starting this is optional.
+"""
+
+import importlib.util
+import os
+import sys
+
+def load_cli_module():
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "memos-cli.py")
+    spec = importlib.util.spec_from_file_location("memos_cli", script)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["memos_cli"] = module
+    spec.loader.exec_module(module)
+    return module
+
+if __name__ == "__main__":
+    load_cli_module().serve_daemon()